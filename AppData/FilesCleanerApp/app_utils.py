@@ -8,17 +8,174 @@ root_folder : str
     from this location without exceptions.
 """
 
+import mmap
 import os
-
-from fnmatch import fnmatch
+import re
+import stat
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate
+from functools import lru_cache
+from importlib import import_module
+from itertools import compress
+from itertools import islice
+from operator import attrgetter
 from shutil import rmtree
 
 from .python_utils import prompts
 from .python_utils.ansi_colors import Ansi
 
 
-root_folder = os.path.realpath(os.path.abspath(os.path.join(
-    os.path.normpath(os.getcwd()))))
+_entry_path = attrgetter("path")
+# Line endings that need to be converted and trailing white space that needs to be removed.
+_line_end_re = re.compile(rb"[ \t\v\f]*\r\n?|[ \t\v\f]+\n")
+
+root_folder = os.path.realpath(os.getcwd())
+
+
+def _read_dir(path):
+    """Read the entries of a folder.
+
+    Parameters
+    ----------
+    path : str
+        Path to a folder.
+
+    Returns
+    -------
+    tuple
+        The lists of :any:`os.DirEntry` for the sub-folders and for the rest of the entries.
+        Both lists are empty if the folder cannot be read.
+    """
+    dirs = []
+    files = []
+
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                # Symbolic links are never followed. Links to folders are listed with files.
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry)
+                else:
+                    files.append(entry)
+    except OSError:
+        return [], []
+
+    return dirs, files
+
+
+@lru_cache(maxsize=None)
+def _optional_import(name):
+    """Import an optional module the first time it's needed.
+
+    NumPy alone takes longer to import than most runs of the application take to complete, so
+    optional modules aren't imported until they can actually be used.
+
+    Parameters
+    ----------
+    name : str
+        The module name.
+
+    Returns
+    -------
+    module
+        The imported module or None if it isn't installed.
+    """
+    try:
+        return import_module(name)
+    except ImportError:
+        return None
+
+
+def has_clean_endings(content):
+    """Check if a file's content has only Unix line endings and no trailing white space.
+
+    The content is checked with vectorized NumPy operations, which is considerably faster than
+    scanning it with a regular expression. NumPy must be installed.
+
+    Parameters
+    ----------
+    content : bytes, mmap.mmap
+        The content of a file. It shouldn't be empty.
+
+    Returns
+    -------
+    bool
+        True if :any:`FilesCleaner._clean_endings` would leave the content untouched.
+    """
+    numpy = _optional_import("numpy")
+    data = numpy.frombuffer(content, dtype=numpy.uint8)
+
+    if data[-1] != 0x0A or (data == 0x0D).any():
+        return False
+
+    # The characters preceding line feeds.
+    before_lf = data[:-1][data[1:] == 0x0A]
+
+    return not numpy.isin(before_lf, (0x09, 0x0B, 0x0C, 0x20)).any()
+
+
+def compile_glob_patterns(patterns, hyperscan_min_patterns=9):
+    """Compile glob patterns into a single matcher.
+
+    The patterns are translated into regular expressions and joined. When Hyperscan is available
+    and there are many patterns, they are compiled into a Hyperscan database, which matches all
+    of them in a single pass over a path no matter how many there are.
+
+    Parameters
+    ----------
+    patterns : list
+        The glob patterns to compile.
+    hyperscan_min_patterns : int, optional
+        Minimum amount of patterns from which Hyperscan is used.
+
+    Returns
+    -------
+    method
+        A function that takes a path and returns a truthy value if it matches any of the patterns.
+    """
+    expressions = [translate(p) for p in patterns]
+    match = re.compile("|".join(expressions)).match
+
+    if len(patterns) < hyperscan_min_patterns or not all(p.isascii() for p in patterns):
+        return match
+
+    hyperscan = _optional_import("hyperscan")
+
+    if hyperscan is None:
+        return match
+
+    # fnmatch uses atomic groups only to avoid backtracking. Hyperscan doesn't support them, but
+    # plain groups match the same paths. Hyperscan also matches anywhere if not anchored.
+    hs_expressions = []
+
+    for e in expressions:
+        e = re.sub(r"\\[Zz]$", "", e).replace("(?>.*?", "(?:.*?")
+        hs_expressions.append(("^%s\\z" % e).encode())
+
+    database = hyperscan.Database()
+
+    try:
+        database.compile(expressions=hs_expressions,
+                         ids=list(range(len(hs_expressions))),
+                         elements=len(hs_expressions),
+                         flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_DOTALL] *
+                         len(hs_expressions))
+    except hyperscan.error:
+        return match
+
+    def hs_match(path):
+        # Hyperscan matches bytes. Only ASCII paths have one byte per character.
+        if not path.isascii():
+            return match(path)
+
+        found = []
+        database.scan(path.encode(), match_event_handler=lambda *args: found.append(True))
+
+        return found
+
+    return hs_match
 
 
 class FilesCleaner(object):
@@ -28,15 +185,25 @@ class FilesCleaner(object):
     ----------
     actions : dict
         Possible actions to perform.
+    batch_size : int
+        Amount of files submitted at once to the threads handling them.
     cum_size : float
-        Accumulated files size.
+        Accumulated size of the files among the targets. Folders and their contents aren't
+        included.
     logger : object
         See <class :any:`LogSystem`>.
     matchers : dict
         A dictionary of boolean function which takes a string and tries to match it against any
         one of the specified patterns, returning False otherwise.
+    max_workers : int
+        Amount of threads used to handle files when no confirmation is asked for each of them.
+    mmap_min_size : int
+        Size in bytes from which files are memory mapped to clean their line endings.
     messages : dict
         Storage for messages used by the actions.
+    read_ahead : int
+        Maximum amount of folders read ahead of time while scanning. It bounds the memory used
+        by folder listings that are waiting to be filtered.
     targets : list
         The list of files/folders on which to perform actions.
 
@@ -44,6 +211,10 @@ class FilesCleaner(object):
     ----
     Based on: `a recipe from ActiveState <http://code.activestate.com/recipes/576643/>`__
     """
+    batch_size = 128
+    max_workers = 8
+    mmap_min_size = 64 * 1024
+    read_ahead = 16
 
     def __init__(self, path, patterns, negate, logger):
         """Initialize.
@@ -64,12 +235,17 @@ class FilesCleaner(object):
         self._negate = negate
         self.logger = logger
 
+        # Compile the patterns only once. All glob patterns are joined into a single matcher
+        # and str.endswith accepts a tuple of suffixes.
+        self._glob_match = compile_glob_patterns(patterns)
+        self._endswith_tuple = endswith_tuple = tuple(patterns)
+
         self.matchers = {
             # A matcher is a boolean function which takes a string and tries
             # to match it against any one of the specified patterns,
             # returning False otherwise
-            "endswith": lambda s: any(s.endswith(p) for p in patterns),
-            "glob": lambda s: any(fnmatch(s, p) for p in patterns),
+            "endswith": lambda s: s.endswith(endswith_tuple),
+            "glob": self._glob_match,
         }
         self.actions = {
             # action: (path_operating_func, matcher)
@@ -85,6 +261,9 @@ class FilesCleaner(object):
         }
         self.targets = []
         self.cum_size = 0.0
+        # The os.DirEntry of each target. They carry the file type and stat results obtained
+        # while scanning, so handling a target doesn't need to query the file system again.
+        self._target_entries = {}
 
     def __repr__(self):
         """__repr__ override.
@@ -103,46 +282,50 @@ class FilesCleaner(object):
         Parameters
         ----------
         func : method
-            The method used to handle a target depending on the action.
+            The method used to handle a target depending on the action. It returns whether the
+            target was modified.
         confirm : bool, optional
             Ask for confirmation before performing an action.
         """
         i = 0
         errors = []
         question = "\n**{message} '{path}' \n{prompt}** "
-
-        for target in self.targets:
-            if confirm:
-                answer = prompts.read_char(question.format(
-                    message=self.messages[func.__name__][0],
-                    path=target,
-                    prompt=Ansi.LIGHT_YELLOW(
-                        # Clean string:
-                        # "(Yes/No/Abort)?"
-                        "**(\033[4mY\033[24mes/\033[4mN\033[24mo/\033[4mA\033[24mbort)?**")
-                ))
-
-                if answer in {"y", "Y"}:  # i.e., Yes
-                    try:
-                        func(target)
-                        i += 1
-                    except Exception as err:
-                        errors.append((func.__name__, target, str(err)))
-                elif answer in {"a", "A"}:  # i.e., Abort
-                    break
-                else:  # i.e., No
-                    continue
-            else:
-                try:
-                    func(target)
-                    i += 1
-                except Exception as err:
-                    errors.append(str(err))
+        # Folders aren't sized while scanning, nor is their content, so the accumulated size
+        # is only reported when all targets are files.
+        sized = not any(map(self._is_dir, self.targets))
+
+        if confirm:
+            with prompts.raw_stdin():
+                for target in self.targets:
+                    answer = prompts.read_raw_char(question.format(
+                        message=self.messages[func.__name__][0],
+                        path=target,
+                        prompt=Ansi.LIGHT_YELLOW(
+                            # Clean string:
+                            # "(Yes/No/Abort)?"
+                            "**(\033[4mY\033[24mes/\033[4mN\033[24mo/\033[4mA\033[24mbort)?**")
+                    ))
+
+                    if answer in {"y", "Y"}:  # i.e., Yes
+                        try:
+                            if func(target):
+                                i += 1
+                        except Exception as err:
+                            errors.append((func.__name__, target, str(err)))
+                    elif answer in {"a", "A"}:  # i.e., Abort
+                        break
+                    else:  # i.e., No
+                        continue
+        else:
+            i, errors = self._apply_all(func)
 
         if i:
-            self.logger.info("**%s %s items (%sK)**" % (
-                self.messages[func.__name__][1], i, int(round(self.cum_size / 1024.0, 0))
-            ), date=False)
+            summary = "%s %s items" % (self.messages[func.__name__][1], i)
+
+            if sized:
+                summary += " (%sK)" % int(round(self.cum_size / 1024.0, 0))
+
+            self.logger.info("**%s**" % summary, date=False)
         else:
             self.logger.info("**No action taken**", date=False)
 
@@ -151,8 +334,58 @@ class FilesCleaner(object):
                 self.logger.error("**The following errors were found:**")
                 self.logger.error(err, date=False)
 
+    def _apply_all(self, func):
+        """Applies a function to all target paths without confirmation.
+
+        Files are handled concurrently by a pool of threads since handling them is mostly waiting
+        on blocking system calls. Folders are handled afterwards one at a time, so a folder is never
+        removed while a file inside it is still being handled.
+
+        Parameters
+        ----------
+        func : method
+            The method used to handle a target depending on the action. See :any:`_apply`.
+
+        Returns
+        -------
+        tuple
+            The amount of modified targets and the list of errors found.
+        """
+        def apply(target):
+            try:
+                return func(target), None
+            except Exception as err:
+                return False, str(err)
+
+        is_dir = self._is_dir
+        dirs = [t for t in self.targets if is_dir(t)]
+        files = (t for t in self.targets if not is_dir(t))
+
+        def results():
+            if len(self.targets) - len(dirs) > 1:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    # Feed the files to the pool in batches so the amount of pending work is
+                    # bounded no matter how many targets there are.
+                    for batch in iter(lambda: list(islice(files, self.batch_size)), []):
+                        yield from executor.map(apply, batch)
+            else:
+                yield from map(apply, files)
+
+            yield from map(apply, dirs)
+
+        modified = 0
+        errors = []
+
+        for changed, err in results():
+            if err is not None:
+                errors.append(err)
+            elif changed:
+                modified += 1
+
+        return modified, errors
+
     @staticmethod
-    def _onerror(func, path, exc_info):
+    def _onexc(func, path, exc):
         """Error handler for :any:`shutil.rmtree`.
 
         If the error is due to an access error (read only file)
@@ -166,26 +399,46 @@ class FilesCleaner(object):
             The function that triggered the error.
         path : str
             Argument to be used by func.
-        exc_info : tuple
-            A tuple returned by sys.exc_info().
+        exc : Exception
+            The exception raised by func.
 
         Example
         -------
         .. code::
 
-            shutil.rmtree(path, onerror=onerror)
+            shutil.rmtree(path, onexc=onexc)
 
         Original code by Michael Foord.
         Bug fix suggested by Kun Zhang.
         """
-        import stat
-
-        if not os.access(path, os.W_OK):
-            # Is the error an access error ?
-            os.chmod(path, stat.S_IWUSR)
+        # A writable path can't be fixed by changing its own mode. Its parent folder is the one
+        # preventing the removal.
+        if isinstance(exc, PermissionError) and not os.access(path, os.W_OK):
+            os.chmod(path, stat.S_IMODE(os.lstat(path).st_mode) | stat.S_IWUSR)
             func(path)
         else:
-            raise
+            raise exc
+
+    @staticmethod
+    def _onerror(func, path, exc_info):
+        """Error handler for :any:`shutil.rmtree` on Python versions older than 3.12.
+
+        Parameters
+        ----------
+        func : method
+            The function that triggered the error.
+        path : str
+            Argument to be used by func.
+        exc_info : tuple
+            A tuple returned by sys.exc_info().
+
+        Example
+        -------
+        .. code::
+
+            shutil.rmtree(path, onerror=onerror)
+        """
+        FilesCleaner._onexc(func, path, exc_info[1])
 
     def run(self, action):
         """Finds pattern and approves action on results.
@@ -198,25 +451,15 @@ class FilesCleaner(object):
         self.logger.info("**Working inside directory:**\n%s" % self._path, date=False)
         func, matcher = self.actions[action]
 
-        def show(path):
-            """Function used to filter paths.
-
-            Parameters
-            ----------
-            path : str
-                The path to apply the filter on.
-
-            Returns
-            -------
-            bool
-                If the path should be shown of not.
-            """
-            if self._negate:
-                return path if not self.matchers[matcher](path) else None
-            else:
-                return path if self.matchers[matcher](path) else None
+        # Specialize the filter function once instead of checking for negation on every path.
+        predicate = self.matchers[matcher]
+
+        if self._negate:
+            predicate = lambda path, match=predicate: not match(path)  # noqa: E731
 
-        results = self._walk(self._path, show)
+        # Folders matched for deletion are removed with all their content. There is no need to
+        # look inside them.
+        results = list(self._scan(self._path, predicate, prune=func == self._delete))
 
         if results:
             question = "**{results} item(s) found. {message} {prompt}** "
@@ -240,64 +483,158 @@ class FilesCleaner(object):
         else:
             self.logger.info("**No results.**", date=False)
 
-    def _walk(self, path, func):
-        """Walk path recursively collecting results of function application.
+    def _scan(self, path, func, prune=False):
+        """Scan path recursively yielding the paths accepted by a filter function.
+
+        Directories are yielded before files and a directory's content is scanned only after
+        all of its direct entries were visited.
+
+        Folders are read by a pool of threads ahead of time, but their entries are always filtered
+        in the same order in which they would be read one by one. No more than
+        :any:`FilesCleaner.read_ahead` folders are read ahead at any given time.
 
         Parameters
         ----------
         path : str
-            The path to *walk*.
+            The path to *scan*.
+        func : method
+            The function used to filter the *scanned* path.
+        prune : bool, optional
+            Do not scan the content of accepted folders.
+
+        Yields
+        ------
+        str
+            A file/folder path.
+        """
+        # Folders left to scan. The next one to scan is the last one.
+        pending = [path]
+        # The folders being read ahead of time, by path.
+        listings = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending:
+                folder = pending.pop()
+                listing = listings.pop(folder, None)
+                dirs, files = listing.result() if listing is not None else _read_dir(folder)
+                dirs = yield from self._filter_listing(dirs, files, func, prune)
+                # Sub-folders are scanned before the rest of the pending folders.
+                pending.extend(reversed([entry.path for entry in dirs]))
+
+                # Read ahead the next folders to scan.
+                for next_folder in reversed(pending):
+                    if len(listings) >= self.read_ahead:
+                        break
+
+                    if next_folder not in listings:
+                        listings[next_folder] = executor.submit(_read_dir, next_folder)
+
+    def _filter_listing(self, dirs, files, func, prune):
+        """Filter the entries of a folder.
+
+        Parameters
+        ----------
+        dirs : list
+            The folder's sub-folders. See :any:`_read_dir`.
+        files : list
+            The rest of the folder's entries. See :any:`_read_dir`.
         func : method
-            The function used to filter the *walked* path.
+            The function used to filter the *scanned* path.
+        prune : bool
+            Do not scan the content of accepted folders.
+
+        Yields
+        ------
+        str
+            A file/folder path.
 
         Returns
         -------
         list
-            The list of files/folders paths.
+            The sub-folders to scan.
         """
-        results = []
+        # Filter each directory's entries as a batch, like fnmatch.filter does with a list of
+        # names. The per entry work is a single call to the matcher. Only the regular expression
+        # based "glob" matcher runs entirely in C. The "endswith" matcher, negated patterns and
+        # the Hyperscan matcher still execute one Python function call per entry.
+        accepted_dirs = list(compress(dirs, map(func, map(_entry_path, dirs))))
+        # Local bindings for the loops below. They can run millions of times.
+        target_entries = self._target_entries
+        log = self.logger.info
+        # All scanned paths start with the scanned root folder path, so the relative paths
+        # displayed are just slices of them.
+        start = len(os.path.join(self._path, ""))
+        size = 0
+
+        for entry in accepted_dirs:
+            path = entry.path
+            target_entries[path] = entry
+            log("**+-->** %s" % path[start:], date=False)
+            yield path
+
+        for entry in compress(files, map(func, map(_entry_path, files))):
+            path = entry.path
+            target_entries[path] = entry
+            size += entry.stat(follow_symlinks=False).st_size
+            log("**|-->** %s" % path[start:], date=False)
+            yield path
+
+        self.cum_size += size
+
+        if prune and accepted_dirs:
+            accepted_dirs = set(accepted_dirs)
+            dirs = [entry for entry in dirs if entry not in accepted_dirs]
+
+        return dirs
+
+    def _is_dir(self, path):
+        """Check if a target is a folder. Symbolic links are never followed.
 
-        def visit(root, target, prefix):
-            """Visit path.
-
-            Parameters
-            ----------
-            root : str
-                The root folder to *walk*.
-            target : str
-                The list of files/folders relative to the root folder.
-            prefix : str
-                Prefix used to differentiate files form folders.
-            """
-            for t in target:
-                item = os.path.join(root, t)
-                obj = func(item)
-
-                if obj:
-                    results.append(obj)
-                    self.cum_size += os.path.getsize(obj)
+        Parameters
+        ----------
+        path : str
+            The path to a target.
 
-                    self.logger.info("**%s** %s" %
-                                     (prefix, os.path.relpath(obj, self._path)), date=False)
+        Returns
+        -------
+        bool
+            Whether the path is a folder. The file type stored while scanning is used when
+            available, otherwise the file system is queried.
+        """
+        entry = self._target_entries.get(path)
 
-        for root, dirs, files in os.walk(path):
-            visit(root, dirs, "+-->")
-            visit(root, files, "|-->")
+        if entry is not None:
+            return entry.is_dir(follow_symlinks=False)
 
-        return results
+        return os.path.isdir(path) and not os.path.islink(path)
 
     def _delete(self, path):
         """Delete path.
 
+        Symbolic links are removed themselves, never their targets.
+
         Parameters
         ----------
         path : str
             The path to the file to delete.
+
+        Returns
+        -------
+        bool
+            Whether the path was deleted. It is False if the path no longer exists.
         """
-        if os.path.isfile(path):
-            os.remove(path)
-        elif os.path.isdir(path):
-            rmtree(path, onerror=self._onerror)
+        try:
+            if self._is_dir(path):
+                if sys.version_info >= (3, 12):
+                    rmtree(path, onexc=self._onexc)
+                else:
+                    rmtree(path, onerror=self._onerror)
+            else:
+                os.remove(path)
+        except FileNotFoundError:
+            return False
+
+        return True
 
     def _clean_endings(self, path):
         """Convert Windows line endings to Unix line endings.
@@ -306,14 +643,40 @@ class FilesCleaner(object):
         ----------
         path : str
             The path to the file to "clean up".
+
+        Returns
+        -------
+        bool
+            Whether the file was modified. Files that are already clean aren't rewritten.
         """
-        with open(path, "r", encoding="cp1252") as old:
-            lines = old.readlines()
+        entry = self._target_entries.get(path)
+        size = entry.stat().st_size if entry is not None else os.path.getsize(path)
+
+        if not size:
+            return False
+
+        with open(path, "rb") as old:
+            if size < self.mmap_min_size:
+                # Mapping a small file costs more than copying it.
+                data, changes = _line_end_re.subn(b"\n", old.read())
+            else:
+                # Let the regular expression scan the mapped file instead of a copy of it.
+                with mmap.mmap(old.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    if _optional_import("numpy") is not None and has_clean_endings(content):
+                        return False
+
+                    data, changes = _line_end_re.subn(b"\n", content)
+
+        if data.endswith(b"\n"):
+            if not changes:
+                return False
+        else:
+            data = data.rstrip(b" \t\v\f") + b"\n"
 
-        string = "".join(l.rstrip() + "\n" for l in lines)
+        with open(path, "wb") as new:
+            new.write(data)
 
-        with open(path, "w", encoding="UTF-8") as new:
-            new.write(string)
+        return True
 
 
 if __name__ == "__main__":
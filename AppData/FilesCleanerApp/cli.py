@@ -3,16 +3,23 @@
 
 Attributes
 ----------
+bash_completions_template_path : str
+    Path to the template used to generate the bash completions file.
 docopt_doc : str
     Used to store/define the docstring that will be passed to docopt as the "doc" argument.
+man_page_path : str
+    Path to the application manual page.
 root_folder : str
     The main folder containing the application. All commands must be executed from this location
     without exceptions.
+sys_exec_template_path : str
+    Path to the template used to generate the system executable.
 """
 
 import os
 
-from . import app_utils
+from functools import partial
+
 from .__init__ import __appdescription__
 from .__init__ import __appname__
 from .__init__ import __status__
@@ -21,8 +28,12 @@ from .python_utils import cli_utils
 from .python_utils import exceptions
 
 
-root_folder = os.path.realpath(os.path.abspath(os.path.join(
-    os.path.normpath(os.getcwd()))))
+root_folder = os.path.realpath(os.getcwd())
+sys_exec_template_path = os.path.join(
+    root_folder, "AppData", "data", "templates", "system_executable")
+bash_completions_template_path = os.path.join(
+    root_folder, "AppData", "data", "templates", "bash_completions.bash")
+man_page_path = os.path.join(root_folder, "AppData", "data", "man", "app.py.1")
 
 docopt_doc = """{appname} {version} ({status})
 
@@ -67,6 +78,15 @@ Options:
 Important note:
     Each pattern in <patterns> should always be quoted.
 
+Environment variables:
+    FILESCLEANER_LOG_UNBUFFERED
+        on: Log messages are written to the log file as soon as they are
+            logged. Useful when debugging a crash. Any other value not
+            listed below (like 1, true or yes) has the same effect.
+        off, default: Log messages are buffered and written to the log
+            file periodically and at exit (the default). 0, false, no or
+            an empty value have the same effect.
+
 """.format(appname=__appname__,
            appdescription=__appdescription__,
            version=__version__,
@@ -86,8 +106,6 @@ class CommandLineInterface(cli_utils.CommandLineInterfaceSuper):
         Set the method that will be executed when calling CommandLineTool.run().
     cleaner : object
         See <class :any:`app_utils.FilesCleaner`>.
-    glob_deletion : bool
-        Whether or not to interpret the passed patters as glob patterns.
     """
     action = None
 
@@ -100,43 +118,47 @@ class CommandLineInterface(cli_utils.CommandLineInterfaceSuper):
 
         Raises
         ------
-        exceptions.MissingArgument
+        exceptions.MissingMandatoryArgument
             Missing mandatory argument not passed.
         """
-        self.a = docopt_args
-        self._cli_header_blacklist = [self.a["--manual"]]
-
-        super().__init__(__appname__)
-
-        if not self.a["generate"] and not self.a["system_executable"] \
-                and not self.a["--path"] and not self.a["--manual"]:
-            msg = "Missing `--path` option.\n"
-            msg += "Due to its nature, it is recommended to generate this application's\n"
-            msg += "system executable and make use of it.\n"
-            msg += "In doing so, the `--path` option will be automatically populated\n"
-            msg += "with the current working directory.\n"
-            msg += "Additional `--path` options can be passed."
-            raise exceptions.MissingArgument(msg)
-
-        if self.a["--manual"]:
+        a = self.a = docopt_args
+        self._cli_header_blacklist = [a["--manual"]]
+
+        unbuffered_log = os.environ.get("FILESCLEANER_LOG_UNBUFFERED", "").strip().lower()
+
+        super().__init__(__appname__,
+                         buffered_log=unbuffered_log in ("", "0", "false", "no", "off", "default"))
+
+        if a["--manual"]:
             self.action = self.display_manual_page
-        elif self.a["del"] or self.a["edit"]:
-            self.glob_deletion = self.a["--glob"]
-            self.cleaner = app_utils.FilesCleaner(path=self.a["--path"],
-                                                  patterns=self.a["<patterns>"],
-                                                  negate=self.a["--negate"],
+        elif a["generate"]:
+            self.logger.info("**System executable generation...**")
+            self.action = self.system_executable_generation
+        elif not a["--path"]:
+            raise exceptions.MissingMandatoryArgument(
+                "Missing `--path` option.\n"
+                "Due to its nature, it is recommended to generate this application's\n"
+                "system executable and make use of it.\n"
+                "In doing so, the `--path` option will be automatically populated\n"
+                "with the current working directory.\n"
+                "Additional `--path` options can be passed.")
+        else:
+            from . import app_utils
+
+            self.cleaner = app_utils.FilesCleaner(path=a["--path"],
+                                                  patterns=a["<patterns>"],
+                                                  negate=a["--negate"],
                                                   logger=self.logger)
-            if self.a["del"]:
-                self.logger.info("**Deleting files...**")
-                self.action = self.delete
-
-            if self.a["edit"]:
-                self.logger.info("**Cleaning files...**")
-                self.action = self.edit
-        elif self.a["generate"]:
-            if self.a["system_executable"]:
-                self.logger.info("**System executable generation...**")
-                self.action = self.system_executable_generation
+            # The only commands left are "del" and "edit".
+            if a["del"]:
+                msg = "**Deleting files...**"
+                mode = "glob_delete" if a["--glob"] else "endswith_delete"
+            else:
+                msg = "**Cleaning files...**"
+                mode = "convert"
+
+            self.logger.info(msg)
+            self.action = partial(self.cleaner.run, mode)
 
     def run(self):
         """Execute the assigned action stored in self.action if any.
@@ -144,33 +166,21 @@ class CommandLineInterface(cli_utils.CommandLineInterfaceSuper):
         if self.action is not None:
             self.action()
 
-    def delete(self):
-        """See :any:`app_utils.FilesCleaner._delete`
-        """
-        self.cleaner.run("glob_delete" if self.glob_deletion else "endswith_delete")
-
-    def edit(self):
-        """See :any:`app_utils.FilesCleaner._clean_endings`
-        """
-        self.cleaner.run("convert")
-
     def system_executable_generation(self):
         """See :any:`cli_utils.CommandLineInterfaceSuper._system_executable_generation`.
         """
         self._system_executable_generation(
             exec_name="files-cleaner-cli",
             app_root_folder=root_folder,
-            sys_exec_template_path=os.path.join(
-                root_folder, "AppData", "data", "templates", "system_executable"),
-            bash_completions_template_path=os.path.join(
-                root_folder, "AppData", "data", "templates", "bash_completions.bash"),
+            sys_exec_template_path=sys_exec_template_path,
+            bash_completions_template_path=bash_completions_template_path,
             logger=self.logger
         )
 
     def display_manual_page(self):
         """See :any:`cli_utils.CommandLineInterfaceSuper._display_manual_page`.
         """
-        self._display_manual_page(os.path.join(root_folder, "AppData", "data", "man", "app.py.1"))
+        self._display_manual_page(man_page_path)
 
 
 def main():
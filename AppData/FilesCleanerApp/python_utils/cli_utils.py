@@ -2,13 +2,10 @@
 """Command line interface utilities.
 """
 import os
+import signal
 import sys
 
 from . import exceptions
-from . import file_utils
-from . import log_system
-from . import shell_utils
-from .docopt import docopt
 
 if sys.version_info < (3, 5):
     raise exceptions.WrongPythonVersion()
@@ -28,7 +25,7 @@ class CommandLineInterfaceSuper():
     _print_log_blacklist = []
     _inhibit_logger_list = []
 
-    def __init__(self, app_name, logs_storage_dir="UserData/logs"):
+    def __init__(self, app_name, logs_storage_dir="UserData/logs", buffered_log=False):
         """Initialization.
 
         Parameters
@@ -37,35 +34,67 @@ class CommandLineInterfaceSuper():
             Application name.
         logs_storage_dir : str
             Log files storage location.
+        buffered_log : bool, optional
+            Buffer the writes to the log file. See :any:`log_system.LogSystem`. The buffered
+            log file is also flushed when the application is terminated with SIGTERM.
         """
         self._app_name = app_name
         self.logger = None
 
         if not self._inhibit_logger_list or not any(self._inhibit_logger_list):
+            from . import file_utils
+            from . import log_system
+
             log_file = log_system.generate_log_path(storage_dir=logs_storage_dir,
                                                     prefix="CLI")
             file_utils.remove_surplus_files(logs_storage_dir, "CLI*")
-            self.logger = log_system.LogSystem(log_file, verbose=True)
+            self.logger = log_system.LogSystem(log_file, verbose=True,
+                                               buffered=buffered_log)
+
+            if buffered_log:
+                signal.signal(signal.SIGTERM, self._flush_log_and_terminate)
 
         self._display_cli_header()
 
+    def _flush_log_and_terminate(self, signum, frame):
+        """Flush the buffered log file and terminate the application with the default action of
+        the received signal.
+
+        Parameters
+        ----------
+        signum : int
+            The received signal.
+        frame : frame
+            The interrupted stack frame.
+        """
+        self.logger.flush()
+        signal.signal(signum, signal.SIG_DFL)
+        os.kill(os.getpid(), signum)
+
     def _display_cli_header(self):
         """Display CLI header.
         """
-        if self.logger and (not self._cli_header_blacklist or not any(self._cli_header_blacklist)):
-            self.logger.info("**%s**" % shell_utils.get_cli_header(self._app_name),
+        # The header is only displayed in the terminal, so it isn't generated if the logger
+        # doesn't print to it.
+        if self.logger and self.logger.verbose and \
+                (not self._cli_header_blacklist or not any(self._cli_header_blacklist)):
+            from . import shell_utils
+
+            self.logger.info("**%s**\n" % shell_utils.get_cli_header(self._app_name),
                              date=False, to_file=False)
-            print("")
 
     def print_log_file(self):
         """Print the path to the log file used by the current logger.
         """
         if self.logger and (not self._print_log_blacklist or not any(self._print_log_blacklist)):
+            from . import shell_utils
+
+            separator = shell_utils.get_cli_separator("-")
             print()
-            self.logger.info(shell_utils.get_cli_separator("-"), date=False, to_file=False)
+            self.logger.info(separator, date=False, to_file=False)
             self.logger.warning("**Log file location:**", date=False, to_file=False)
             self.logger.warning("**%s**" % self.logger.get_log_file(), date=False, to_file=False)
-            self.logger.info(shell_utils.get_cli_separator("-"), date=False, to_file=False)
+            self.logger.info(separator, date=False, to_file=False)
 
     def run(self):
         """Execute the assigned action stored in self.action if any.
@@ -127,13 +156,30 @@ def run_cli(flag_file="", docopt_doc="", app_name="",
         Do not allow to run any command if the *flag* file isn't found where it should be.
         See :any:`exceptions.BadExecutionLocation`.
     """
-    if not os.path.exists(flag_file):
-        raise exceptions.BadExecutionLocation()
+    version = "%s %s%s" % (app_name, app_version, " (%s)" % app_status if app_status else "")
+    argv = sys.argv[1:]
+
+    # The help message and the version are constant. There is no need to parse the command line
+    # to display them, nor to launch the application from its root folder.
+    if argv in (["-h"], ["--help"], ["--version"]):
+        from .docopt import print_bold
+        from .docopt import print_help
+
+        if argv == ["--version"]:
+            print_bold(version)
+        else:
+            print_help(docopt_doc)
+
+        return
+
+    try:
+        os.stat(flag_file)
+    except FileNotFoundError:
+        raise exceptions.BadExecutionLocation() from None
+
+    from .docopt import docopt
 
-    arguments = docopt(docopt_doc, version="%s %s%s" %
-                       (app_name,
-                        app_version,
-                        " (%s)" % app_status if app_status else ""))
+    arguments = docopt(docopt_doc, argv=argv, version=version)
     cli = cli_class(arguments)
     cli.run()
 
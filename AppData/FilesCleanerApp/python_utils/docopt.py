@@ -18,6 +18,10 @@
     It will highlight in bold any text surrounded with double asterisks (e.g. **bold text**). \
     The parsing is done line by line. It should only be used to highlight words inside \
     options/commands descriptions.
+    - Moved the parsing of ``doc`` into :any:`parse_doc`, which caches its result. The usage \
+    pattern of a given ``doc`` is built only once per process.
+    - Moved the printing of the help message into :any:`print_help` so it can be displayed \
+    without parsing the command line.
 
 .. warning::
     Some warnings/workarounds to bypass some known issues with docopt.
@@ -57,6 +61,8 @@
 import re
 import sys
 
+from functools import lru_cache
+
 
 __all__ = ['docopt']
 __version__ = '0.6.2'
@@ -528,19 +534,23 @@ def print_bold(s):
     print("\033[1m" + s + "\033[0m")
 
 
-def extras(help, version, options, doc):
+def print_help(doc):
     bold_markdown_re = re.compile(r"\*\*([^\*\*]*)\*\*")
     bold_rendered_markdown_placeholder = r'\033[1m\1\033[0m'
 
+    for line in doc.strip("\n").splitlines():
+        if line.startswith((" ", "\t")):
+            line = re.sub(bold_markdown_re, bold_rendered_markdown_placeholder, line)
+            print(line)
+        else:
+            print_bold(line)
+    # Original line
+    # print(doc.strip("\n"))
+
+
+def extras(help, version, options, doc):
     if help and any((o.name in ('-h', '--help')) and o.value for o in options):
-        for line in doc.strip("\n").splitlines():
-            if line.startswith((" ", "\t")):
-                line = re.sub(bold_markdown_re, bold_rendered_markdown_placeholder, line)
-                print(line)
-            else:
-                print_bold(line)
-        # Original line
-        # print(doc.strip("\n"))
+        print_help(doc)
         sys.exit()
 
     if version and any(o.name == '--version' and o.value for o in options):
@@ -556,6 +566,38 @@ class Dict(dict):
         return '{%s}' % ',\n '.join('%r: %r' % i for i in sorted(self.items()))
 
 
+@lru_cache(maxsize=None)
+def parse_doc(doc):
+    """Parse the parts of `doc` that don't depend on the command line arguments.
+
+    Parameters
+    ----------
+    doc : str
+        Description of your command-line interface.
+
+    Returns
+    -------
+    tuple
+        The printable usage, the list of options and the usage pattern.
+    """
+    usage = printable_usage(doc)
+    options = parse_defaults(doc)
+    pattern = parse_pattern(formal_usage(usage), options)
+    # [default] syntax for argument is disabled
+    # for a in pattern.flat(Argument):
+    #    same_name = [d for d in arguments if d.name == a.name]
+    #    if same_name:
+    #        a.value = same_name[0].value
+    pattern_options = set(pattern.flat(Option))
+    for ao in pattern.flat(AnyOptions):
+        doc_options = parse_defaults(doc)
+        ao.children = list(set(doc_options) - pattern_options)
+        # if any_options:
+        #    ao.children += [Option(o.short, o.long, o.argcount)
+        #                    for o in argv if type(o) is Option]
+    return usage, options, pattern.fix()
+
+
 def docopt(doc, argv=None, help=True, version=None, options_first=False):
     """Parse `argv` based on command-line interface described in `doc`.
 
@@ -624,25 +666,11 @@ def docopt(doc, argv=None, help=True, version=None, options_first=False):
     """
     if argv is None:
         argv = sys.argv[1:]
-    DocoptExit.usage = printable_usage(doc)
-    options = parse_defaults(doc)
-    pattern = parse_pattern(formal_usage(DocoptExit.usage), options)
-    # [default] syntax for argument is disabled
-    # for a in pattern.flat(Argument):
-    #    same_name = [d for d in arguments if d.name == a.name]
-    #    if same_name:
-    #        a.value = same_name[0].value
+    DocoptExit.usage, options, pattern = parse_doc(doc)
     argv = parse_argv(TokenStream(argv, DocoptExit), list(options),
                       options_first)
-    pattern_options = set(pattern.flat(Option))
-    for ao in pattern.flat(AnyOptions):
-        doc_options = parse_defaults(doc)
-        ao.children = list(set(doc_options) - pattern_options)
-        # if any_options:
-        #    ao.children += [Option(o.short, o.long, o.argcount)
-        #                    for o in argv if type(o) is Option]
     extras(help, version, argv, doc)
-    matched, left, collected = pattern.fix().match(argv)
+    matched, left, collected = pattern.match(argv)
     if matched and left == []:  # better error message if left?
         return Dict((a.name, a.value) for a in (pattern.flat() + collected))
     raise DocoptExit()
@@ -2,8 +2,11 @@
 """Common utilities to perform file operations.
 """
 import os
+import re
 
+from fnmatch import translate
 from glob import glob
+from operator import attrgetter
 from shutil import copy2
 from shutil import copystat
 from shutil import ignore_patterns
@@ -153,22 +156,43 @@ def recursive_glob(stem, file_pattern):
 def remove_surplus_files(folder, file_pattern, max_files_to_keep=20):
     """Remove surplus files from folder.
 
+    The files are sorted by name and the first ones are removed. Files whose names start with
+    a date (like the ones generated by :any:`log_system.generate_log_path`) are removed from
+    the oldest to the newest.
+
     Parameters
     ----------
     folder : str
-        Path to a folder were to search for files.
-    file_pattern : str
-        The file name pattern to search for.
+        Path to a folder were to search for files. Sub-folders aren't searched.
+    file_pattern : str, callable
+        The file name glob pattern to search for or a function that takes a file name and returns
+        whether it matches.
     max_files_to_keep : int, optional
         Maximum amount of files to keep inside the folder.
     """
-    all_files = sorted(recursive_glob(folder, file_pattern))
+    if callable(file_pattern):
+        match = file_pattern
+    elif file_pattern.endswith("*") and not any(c in file_pattern[:-1] for c in "*?["):
+        # A literal prefix (like "CLI*") doesn't need a regular expression.
+        prefix = file_pattern[:-1]
+
+        def match(name):
+            return name.startswith(prefix)
+    else:
+        match = re.compile(translate(file_pattern)).match
+
+    try:
+        with os.scandir(folder) as entries:
+            all_files = [entry for entry in entries
+                         if match(entry.name) and entry.is_file(follow_symlinks=False)]
+    except FileNotFoundError:
+        return
 
     if len(all_files) > max_files_to_keep:
-        files_to_delete = all_files[:len(all_files) - max_files_to_keep]
+        all_files.sort(key=attrgetter("name"))
 
-        for f in files_to_delete:
-            os.remove(f)
+        for entry in all_files[:len(all_files) - max_files_to_keep]:
+            os.remove(entry.path)
 
 
 def newer(source, target):
@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 """A very simple logging system.
 """
+import atexit
 import logging
 import os
+import queue
+import threading
+
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
 
 from .ansi_colors import Ansi
 from .misc_utils import get_date_time
@@ -32,6 +38,63 @@ _log_levels = {
 }
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that doesn't flush its stream after every record.
+
+    Records are written to a buffered stream that is flushed when its buffer is full, when a
+    record of ``flush_level`` or higher is handled and whenever :any:`BufferedFileHandler.flush`
+    is called.
+    """
+
+    def __init__(self, filename, buffer_size=65536, flush_level=logging.ERROR):
+        """Initialization.
+
+        Parameters
+        ----------
+        filename : str
+            Path to the log file.
+        buffer_size : int, optional
+            Size in bytes of the stream buffer.
+        flush_level : int, optional
+            Records of this level or higher are written to the file immediately.
+        """
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename)
+
+    def _open(self):
+        """Open the log file with a buffer of ``buffer_size`` bytes.
+
+        Returns
+        -------
+        io.TextIOWrapper
+            The opened log file.
+        """
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding)
+
+    def emit(self, record):
+        """Write a record to the stream and only flush it for records of ``flush_level`` or higher.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            The record to log.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 class LogSystem():
     """LogSystem class.
 
@@ -41,7 +104,7 @@ class LogSystem():
         Display message in terminal.
     """
 
-    def __init__(self, filename="log.log", verbose=False):
+    def __init__(self, filename="log.log", verbose=False, buffered=False, flush_interval=1.0):
         """Initialization.
 
         Parameters
@@ -50,6 +113,12 @@ class LogSystem():
             Log file name or path to a file.
         verbose : bool, optional
             Display message in terminal.
+        buffered : bool, optional
+            Buffer the writes to the log file. See :any:`BufferedFileHandler`. The records are
+            written to the log file from a background thread, and the log file is flushed every
+            ``flush_interval`` seconds and at exit.
+        flush_interval : float, optional
+            Interval in seconds between flushes of a buffered log file.
 
         Raises
         ------
@@ -69,9 +138,52 @@ class LogSystem():
         self.verbose = verbose
         self._log_file = filename
         self._user_home = os.path.expanduser("~")
-        logging.basicConfig(filename=filename, level=logging.DEBUG)
+        self._file_handler = None
+        self._listener = None
+        self._stop_flushing = None
+
+        if buffered:
+            records = queue.SimpleQueue()
+            # NOTE: The QueueHandler formats the records before they are queued, so the file
+            # handler is left with the default formatter (the bare message).
+            self._file_handler = BufferedFileHandler(filename)
+            self._listener = QueueListener(records, self._file_handler,
+                                           respect_handler_level=True)
+            self._listener.start()
+            logging.basicConfig(handlers=[QueueHandler(records)], level=logging.DEBUG)
+            self._stop_flushing = threading.Event()
+            threading.Thread(target=self._flush_periodically, args=(flush_interval,),
+                             daemon=True).start()
+            atexit.register(self.flush)
+        else:
+            logging.basicConfig(filename=filename, level=logging.DEBUG)
+
         self._extend()
 
+    def _flush_periodically(self, interval):
+        """Flush the buffered log file every ``interval`` seconds until :any:`LogSystem.flush` is
+        called.
+
+        Parameters
+        ----------
+        interval : float
+            Interval in seconds between flushes.
+        """
+        while not self._stop_flushing.wait(interval):
+            self._file_handler.flush()
+
+    def flush(self):
+        """Write any queued or buffered record to the log file.
+
+        Records logged afterwards are no longer written to the log file in a buffered log
+        system, so this should only be called when done logging. It is called at exit.
+        """
+        if self._listener is not None:
+            self._stop_flushing.set()
+            self._listener.stop()
+            self._listener = None
+            self._file_handler.flush()
+
     def _extend(self):
         """Extend class' functions.
         """
@@ -147,14 +259,20 @@ class LogSystem():
         to_file : bool, optional
             Whether to log message to log file.
         """
-        now = "%s: " % micro_to_milli(get_date_time())
+        term = self.verbose and term
+
+        if not to_file and not term:
+            return
+
+        # The date is only formatted when it is going to be logged.
+        now = "%s: " % micro_to_milli(get_date_time()) if date else ""
         m = str(msg)
 
         if to_file:
             getattr(logging, "info" if (log_level not in _log_levels or not _log_levels[log_level].get(
-                "logging_support")) else log_level.lower())(now + m if date else m)
+                "logging_support")) else log_level.lower())(now + m)
 
-        if self.verbose and term:
+        if term:
             pm = ("**%s**" % now) + m if date else m
 
             try:
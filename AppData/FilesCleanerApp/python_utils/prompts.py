@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 """CLI prompts and confirmation "dialogs" utilities.
 """
+import os
 import sys
 import termios
 import tty
 
+from contextlib import contextmanager
+
 from . import exceptions
 from .ansi_colors import Ansi
 
@@ -260,5 +263,60 @@ def read_char(txt):
     return ch
 
 
+@contextmanager
+def raw_stdin():
+    """Put standard input in raw mode.
+
+    Meant to be used with :any:`read_raw_char` to read several characters while setting up the
+    terminal only once. Output processing is kept enabled so messages can be printed as usual,
+    and so are signals, so Ctrl+C still interrupts whatever is done between the reads.
+    """
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+
+    try:
+        tty.setraw(fd)
+        mode = termios.tcgetattr(fd)
+        mode[1] |= termios.OPOST
+        mode[3] |= termios.ISIG
+        termios.tcsetattr(fd, termios.TCSANOW, mode)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+def read_raw_char(txt):
+    """Read character from standard input already in raw mode.
+
+    Any key pressed before the message is displayed is discarded, so keys typed while a previous
+    answer was being acted upon don't answer this one.
+
+    Parameters
+    ----------
+    txt : str
+        Message to display.
+
+    Returns
+    -------
+    str
+        The read character.
+
+    Example
+    -------
+    .. code::
+
+        with raw_stdin():
+            for question in questions:
+                answer = read_raw_char(question)
+    """
+    print(Ansi.DEFAULT(txt))
+    fd = sys.stdin.fileno()
+    termios.tcflush(fd, termios.TCIFLUSH)
+
+    # Read directly from the file descriptor. The buffer of sys.stdin could hold keys read
+    # ahead of time.
+    return os.read(fd, 1).decode(errors="replace")
+
+
 if __name__ == "__main__":
     pass
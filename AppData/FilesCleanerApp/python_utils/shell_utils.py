@@ -23,23 +23,12 @@ def get_cli_header(name, char="#"):
         The actual "header".
     """
     term_length = get_terminal_size((80, 24))[0] or 80
-    sep = get_cli_separator(char)
+    sep = term_length * char
     sub_sep = "%s" % (int((term_length - (len(name) + 2)) / 2) * char)
-    mid = "%s %s %s" % (sub_sep, name, sub_sep)
+    # Pad with the "decorator" character up to the terminal width.
+    mid = ("%s %s %s" % (sub_sep, name, sub_sep) + term_length * char)[:term_length]
 
-    while True:
-        if len(mid) < term_length:
-            mid += char
-            continue
-
-        if len(mid) >= term_length:
-            break
-
-    header = sep + "\n"
-    header += mid[:term_length] + "\n"
-    header += sep
-
-    return header
+    return "%s\n%s\n%s" % (sep, mid, sep)
 
 
 def get_cli_separator(char="#"):